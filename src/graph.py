@@ -10,7 +10,6 @@ and converts that input into a formula that a SAT solver is able to understand a
 from __future__ import absolute_import, print_function
 
 import argparse
-import itertools
 import os
 import sys
 
@@ -49,21 +48,26 @@ class Graph:
         :param stream: A data stream from which read the graph definition.
         """
         n_edges = -1
-        edges = set()
+        # Each unordered edge {a, b} (a <= b) is packed as (a << 32) | b
+        seen = set()
 
-        reader = (l for l in (ll.strip() for ll in stream) if l)
-        for line in reader:
+        for line in stream:
             l = line.split()
+            if not l:
+                continue  # Ignore blank lines
             if l[0] == 'p':
                 self.n_nodes = int(l[2])
                 n_edges = int(l[3])
             elif l[0] == 'c':
                 pass  # Ignore comments
             else:
-                edges.add(frozenset([int(l[1]), int(l[2])]))
+                a, b = int(l[1]), int(l[2])
+                if a > b:
+                    a, b = b, a
+                seen.add((a << 32) | b)
 
-        self.edges = tuple(tuple(x) for x in edges)
-        if n_edges != len(edges):
+        self.edges = [(k >> 32, k & 0xffffffff) for k in seen]
+        if n_edges != len(seen):
             print("Warning incorrect number of edges")
 
     def visualize(self, name="graph"):
@@ -106,16 +110,15 @@ class Graph:
         # Instantiate the formula
         formula = wcnf.WCNFFormula()
         # Create variables
-        nodes = [formula.new_var() for _ in range(self.n_nodes)]
+        nodes = formula.new_vars(self.n_nodes)
 
         # Soft clauses
-        for n in nodes:
-            formula.add_clause([-n], weight=1)
+        formula.add_unit_clauses(nodes, weight=1, negate=True)
 
         # Hard clauses
-        for e1, e2 in self.edges:
-            v1, v2 = nodes[e1 - 1], nodes[e2 - 1]
-            formula.add_clause([v1, v2], weight=wcnf.TOP_WEIGHT)
+        # Node i is variable i
+        formula.add_clauses([[e1, e2] for e1, e2 in self.edges],
+                            weight=wcnf.TOP_WEIGHT)
 
         # Solve formula
         _, model = solver.solve(formula)
@@ -129,21 +132,42 @@ class Graph:
         :param solver: An instance of MaxSATRunner.
         :return: A solution (list of nodes).
         """
+        # Trivial case: graph without edges
+        if not self.edges:
+            return [1] if self.n_nodes else []
+
+        # Adjacency bitsets: bit u of adj[v] is set iff {u, v} is an edge.
+        # Edges to undeclared nodes can't take part in any pair, skip them.
+        adj = [0] * (self.n_nodes + 1)
+        for a, b in self.edges:
+            if b <= self.n_nodes:
+                adj[a] |= 1 << b
+                adj[b] |= 1 << a
+        all_mask = (1 << (self.n_nodes + 1)) - 2
+
+        # Trivial case: complete graph (self-loops don't count as edges)
+        if all(adj[v] | (1 << v) == all_mask for v in range(1, self.n_nodes + 1)):
+            return list(range(1, self.n_nodes + 1))
+
         # Instantiate the formula
         formula = wcnf.WCNFFormula()
         # Create variables
-        nodes = [formula.new_var() for _ in range(self.n_nodes)]
+        nodes = formula.new_vars(self.n_nodes)
 
         # Soft clauses
-        for n in nodes:
-            formula.add_clause([n], weight=1)
+        formula.add_unit_clauses(nodes, weight=1, negate=False)
 
         # Hard clauses
-        for v1, v2 in itertools.product(range(1, self.n_nodes + 1), range(1, self.n_nodes + 1)):
-
-            # Load only those edges whose first coord is less than the second
-            if (v1, v2) not in self.edges and (v2, v1) not in self.edges and v1 < v2:
-                formula.add_clause([-v1, -v2], weight=wcnf.TOP_WEIGHT)
+        # Every pair of nodes not joined by an edge can't be both in the clique
+        non_edges = []
+        for v1 in range(1, self.n_nodes + 1):
+            # Nodes v2 > v1 that are not adjacent to v1
+            missing = all_mask & ~adj[v1] & ~((1 << (v1 + 1)) - 1)
+            while missing:
+                lowest = missing & -missing
+                non_edges.append([-v1, -(lowest.bit_length() - 1)])
+                missing ^= lowest
+        formula.add_clauses(non_edges, weight=wcnf.TOP_WEIGHT)
 
         # Solve formula
         _, model = solver.solve(formula)
@@ -161,13 +185,11 @@ class Graph:
         formula = wcnf.WCNFFormula()
 
         # Create variables
-        nodes = [formula.new_var() for _ in range(self.n_nodes)]
+        formula.new_vars(self.n_nodes)
 
-        # Soft clauses
-        for e1, e2 in self.edges:
-            v1, v2 = nodes[e1 - 1], nodes[e2 - 1]
-            formula.add_clause([v1, v2], weight=1)
-            formula.add_clause([-v1, -v2], weight=1)
+        # Soft clauses (node i is variable i)
+        formula.add_clauses([[e1, e2] for e1, e2 in self.edges], weight=1)
+        formula.add_clauses([[-e1, -e2] for e1, e2 in self.edges], weight=1)
 
         # No hard clauses
 
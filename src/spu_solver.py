@@ -8,6 +8,7 @@ Our objective is to maximize the number of packages installed
 """
 
 import argparse
+import collections
 import sys
 
 import msat_runner
@@ -28,8 +29,8 @@ class SPU:
         self.solver = solver
 
         # To validate
-        self.dependencies = {}
-        self.conflicts = {}
+        self.dependencies = collections.defaultdict(list)
+        self.conflicts = collections.defaultdict(list)
 
     def generate_formula_and_solve(self, file_path):
         """
@@ -45,24 +46,24 @@ class SPU:
         Discenrns between the different types of input lines (dependencies, conflicts, ...) and
         manages each o
         """
-        reader = (line for line in (lineline.strip() for lineline in stream) if line)
-        for line in reader:
+        handlers = {
+            'n': lambda args: self.manage_package(args[0]),
+            'd': self.manage_dependency,
+            'c': self.manage_conflict,
+        }
+        for line in stream:
             line = line.split()
+            if not line:
+                continue
 
             if line[0] == 'p':
                 self.num_packages = int(line[2])
+                continue
 
-            elif line[0] == 'n':
-                self.manage_package(line[1])
-
-            elif line[0] == 'd':
-                self.manage_dependency(line[1:])
-
-            elif line[0] == 'c':
-                self.manage_conflict(line[1:])
-
-            else:  # If there's a hashtag or any other invalid character, ignore it
-                pass
+            # If there's a hashtag or any other invalid character, ignore it
+            handler = handlers.get(line[0])
+            if handler is not None:
+                handler(line[1:])
 
         # Makes sure that the number of packages told to us in the first line
         # is the same as the number of packages declared further in the file
@@ -84,23 +85,20 @@ class SPU:
         self.formula.new_var()  # Package 1 == Var 1 of the formula13
         self.formula.add_clause([self.packages[package]], weight=1)
 
-        # To validate
-        self.dependencies[package] = []
-        self.conflicts[package] = []
-
     def manage_dependency(self, dependencies):
         """
         Parse the declaration of the dependencies and add its clauses
         """
+        pkgs = self.packages
         dependent = dependencies[0]
         self.check_package(dependent)
-        new_clause = []
+        clause = [-pkgs[dependent]]
         for dependency in dependencies[1:]:
-            self.check_package(dependencies[1])
-            new_clause += [self.packages[dependency]]
+            self.check_package(dependency)
+            clause.append(pkgs[dependency])
 
-        self.dependencies[dependent] += [dependencies[1:]]
-        self.formula.add_clause([-self.packages[dependent]] + new_clause, weight=wcnf.TOP_WEIGHT)
+        self.dependencies[dependent].append(dependencies[1:])
+        self.formula.add_clause(clause, weight=wcnf.TOP_WEIGHT)
 
     def manage_conflict(self, conflicts):
         """
@@ -109,10 +107,10 @@ class SPU:
         self.check_package(conflicts[1])
         conflictable = self.packages[conflicts[0]]
         conflict = self.packages[conflicts[1]]
-        self.formula.add_clause([-conflictable] + [-conflict], weight=wcnf.TOP_WEIGHT)
+        self.formula.add_clause([-conflictable, -conflict], weight=wcnf.TOP_WEIGHT)
 
         # To validate
-        self.conflicts[conflicts[0]] = self.conflicts[conflicts[0]] + [conflicts[1]]
+        self.conflicts[conflicts[0]].append(conflicts[1])
 
     def check_package(self, package):
         """
@@ -127,63 +125,42 @@ class SPU:
         Prints the packages that connot be installed,
         by alfabetical order and with a space between them
         """
-        # Get packages that can't be installed
         opt, model = solution
-        installed_packages = []
-        print("o " + str(opt))
-        print("v", end="")
-        for package in model:
-            if package < 0:
-                installed_packages += [self.package_ids[abs(package)]]
-
-        # Sort packages that can't be installed by alfabetical order
-        installed_packages.sort()
+        # Get packages that can't be installed, sorted by alfabetical order
+        installed_packages = sorted(self.package_ids[abs(package)]
+                                    for package in model if package < 0)
 
-        # Print packages
-        for package in installed_packages:
-            print(" " + package, end="")
-        print()
+        # Print the optimum and the packages with a single write
+        sys.stdout.write("o {0}\n{1}\n".format(opt, " ".join(["v"] + installed_packages)))
 
     def check_solution(self, solution):
         """
         Checks the solution if the "--validate" option has been called
         """
         _, model = solution
-        correct = True
-        for package in model:
-            if package > 0:
-                if not self.ok_dependencies(package, model) or \
-                        not self.ok_conflicts(package, model):
-                    correct = False
-                    break
+        # Names of the packages set to true in the model, computed only once
+        pos_names = {self.package_ids[package] for package in model if package > 0}
+        correct = all(self.ok_dependencies(package, pos_names) and
+                      self.ok_conflicts(package, pos_names)
+                      for package in pos_names)
         if correct:
             print("c VALIDATION OK")
         else:
             print("c VALIDATION WRONG")
 
-    def ok_dependencies(self, package, model):
+    def ok_dependencies(self, package, pos_names):
         """
         Checks if the dependencies of the solution are satisfied
         """
-        sat_dependencies = 0
-        if self.dependencies.get(package) is None:
-            return True
-        for dependance in self.dependencies[package]:
-            for item in dependance:
-                if item in model and item > 0:
-                    sat_dependencies += 1
-                    break
-        return sat_dependencies == len(self.dependencies[package])
+        return all(any(dependency in pos_names for dependency in clause)
+                   for clause in self.dependencies.get(package, ()))
 
-    def ok_conflicts(self, package, model):
+    def ok_conflicts(self, package, pos_names):
         """
         Checks if the conflicts of the solution are satisfied
         """
-        if self.conflicts.get(package) is not None:
-            for conflict in self.conflicts[package]:
-                if conflict in model and conflict > 0:
-                    return False
-        return True
+        return not any(conflict in pos_names
+                       for conflict in self.conflicts.get(package, ()))
 
 
 def main(argv=None):
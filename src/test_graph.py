@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the graph problems, solved with a brute force MaxSAT solver.
+"""
+
+import io
+import itertools
+import sys
+import types
+
+try:
+    import msat_runner  # noqa: F401  pylint: disable=unused-import
+except ImportError:
+    # The solver runner is not needed, the solver is passed in directly
+    sys.modules["msat_runner"] = types.ModuleType("msat_runner")
+
+import graph  # noqa: E402  pylint: disable=wrong-import-position
+
+
+class BruteForceSolver:
+    """Solves small formulas by trying every assignment."""
+
+    @staticmethod
+    def solve(formula):
+        best = None
+        for values in itertools.product((False, True), repeat=formula.num_vars):
+            model = [v if val else -v for v, val in enumerate(values, start=1)]
+            true_lits = set(model)
+            if not all(any(lit in true_lits for lit in c) for c in formula.hard):
+                continue
+            cost = sum(w for w, c in formula.soft if not any(lit in true_lits for lit in c))
+            if best is None or cost < best[0]:
+                best = (cost, model)
+        return best
+
+
+def load_graph(text):
+    g = graph.Graph()
+    g.read_stream(io.StringIO(text))
+    return g
+
+
+def is_clique(g, nodes):
+    edges = {frozenset(e) for e in g.edges}
+    return all(frozenset(p) in edges for p in itertools.combinations(nodes, 2))
+
+
+def test_max_clique_self_loop_is_not_complete():
+    g = load_graph("p edge 3 3\ne 1 1\ne 1 2\ne 2 3\n")
+    clique = g.max_clique(BruteForceSolver())
+    assert len(clique) == 2
+    assert is_clique(g, clique)
+
+
+def test_max_clique_complete_graph_with_self_loop():
+    g = load_graph("p edge 3 4\ne 1 1\ne 1 2\ne 1 3\ne 2 3\n")
+    assert g.max_clique(BruteForceSolver()) == [1, 2, 3]
+
+
+def test_max_clique_without_edges():
+    g = load_graph("p edge 3 0\n")
+    assert g.max_clique(BruteForceSolver()) == [1]
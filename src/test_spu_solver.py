@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the validation of the software package upgrades solutions.
+"""
+
+import io
+import sys
+import types
+
+import pytest
+
+try:
+    import msat_runner  # noqa: F401  pylint: disable=unused-import
+except ImportError:
+    # The solver runner is not needed, the solver is passed in directly
+    sys.modules["msat_runner"] = types.ModuleType("msat_runner")
+
+import spu_solver  # noqa: E402  pylint: disable=wrong-import-position
+
+# Packages a, b, c: a depends on b and a conflicts with c
+PROBLEM = "p spu 3\nn a\nn b\nn c\nd a b\nc a c\n"
+
+
+class FixedSolver:
+    """Returns always the same model."""
+
+    def __init__(self, model):
+        self.model = model
+
+    def solve(self, formula):  # pylint: disable=unused-argument
+        return 0, self.model
+
+
+def validate(model, capsys):
+    spu = spu_solver.SPU(FixedSolver(model))
+    solution = spu.parse_and_solve(io.StringIO(PROBLEM))
+    spu.check_solution(solution)
+    return capsys.readouterr().out.strip()
+
+
+def test_check_solution_ok(capsys):
+    assert validate([1, 2, -3], capsys) == "c VALIDATION OK"
+
+
+@pytest.mark.parametrize("model", [
+    [1, -2, -3],  # a installed without its dependency b
+    [1, 2, 3],  # a installed together with its conflict c
+    [1, -2, 3],  # both at once
+])
+def test_check_solution_wrong(model, capsys):
+    assert validate(model, capsys) == "c VALIDATION WRONG"
@@ -46,8 +46,24 @@ class WCNFFormula:
         :param weight: Weight applied to all the clauses, as in add_clause().
         :type weight: int
         """
+        clauses = list(clauses)
         for clause in clauses:
-            self.add_clause(clause, weight)
+            self._check_literals(clause)
+        self._add_clauses(clauses, weight)
+
+    def add_unit_clauses(self, literals, weight, negate=False):
+        """Adds a unit clause for each one of the given literals, having
+        each one the specified weight.
+
+        :param literals: Iterable of literals.
+        :type literals: list[int]
+        :param weight: Weight applied to all the clauses, as in add_clause().
+        :type weight: int
+        :param negate: Whether to negate the literals before adding them.
+        :type negate: bool
+        """
+        sign = -1 if negate else 1
+        self.add_clauses([[sign * lit] for lit in literals], weight)
 
     def add_clause(self, literals, weight):
         """Adds the given literals as a new clause with the specified weight.
@@ -76,6 +92,18 @@ class WCNFFormula:
         self.num_vars += 1
         return self.num_vars
 
+    def new_vars(self, how_many):
+        """Returns the next how_many free variables of this formula.
+
+        :param how_many: Number of variables to create.
+        :type how_many: int
+        :return: The new variables, in increasing order.
+        :rtype: range
+        """
+        first = self.num_vars + 1
+        self.extend_vars(how_many)
+        return range(first, first + how_many)
+
     def is_13wpm(self, strict=False):
         """Tests if the formula is in 1,3-WPM format."""
         soft_ok = all(len(c) == 1 for _, c in self.soft)
@@ -171,6 +199,13 @@ class WCNFFormula:
             self.soft.append((weight, literals))
             self._sum_soft_weights += weight
 
+    def _add_clauses(self, clauses, weight):
+        if weight < 1:
+            self.hard.extend(clauses)
+        else:
+            self.soft.extend((weight, c) for c in clauses)
+            self._sum_soft_weights += weight * len(clauses)
+
     def _check_literals(self, literals):
         for var in map(abs, literals):
             if var == 0: